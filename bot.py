@@ -1,13 +1,19 @@
 import os
 import asyncio
+import logging
 from dotenv import load_dotenv
 import discord
+from discord import app_commands
 from discord.ext import commands
 from flask import Flask
 import threading
+from utils.log import setup_logging, bind_interaction
+from utils.interactions import DeadlineGuard
 
 # Load environment variables
 load_dotenv()
+setup_logging()
+log = logging.getLogger("xirtam")
 BOT_TOKEN = os.getenv('BOT_TOKEN')
 GUILD_ID = int(os.getenv('GUILD_ID'))
 
@@ -26,13 +32,35 @@ def run_web():
 threading.Thread(target=run_web).start()
 
 # --- Discord Bot Setup ---
+class BotTree(app_commands.CommandTree):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.deadline_guard = DeadlineGuard()
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # Runs in the task that handles this interaction, so the context sticks to every log record it produces.
+        bind_interaction(interaction)
+        await self.deadline_guard.watch(interaction)
+        return True
+
+    async def on_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        self.deadline_guard.finish(interaction)
+        cog = interaction.command.binding if interaction.command else None
+        if isinstance(cog, commands.Cog) and cog.has_app_command_error_handler():
+            return # The cog's own error handler already reported it
+        log.error("Unhandled error in command", exc_info=getattr(error, "original", error))
+
 class MyBot(commands.Bot):
     def __init__(self):
         super().__init__(
             command_prefix='!',  # Prefix is required but we are using slash commands
-            intents=discord.Intents.default()
+            intents=discord.Intents.default(),
+            tree_cls=BotTree
         )
 
+    async def on_app_command_completion(self, interaction: discord.Interaction, command: app_commands.Command):
+        self.tree.deadline_guard.finish(interaction)
+
     async def setup_hook(self):
         # Load all cogs
         for root, dirs, files in os.walk('cogs'):
@@ -42,16 +70,16 @@ class MyBot(commands.Bot):
                     cog_name = path.replace(os.sep, '.')[:-3]
                     try:
                         await self.load_extension(cog_name)
-                        print(f"✅ Loaded cog: {cog_name}")
-                    except Exception as e:
-                        print(f"❌ Failed to load cog {cog_name}: {e}")
+                        log.info("Loaded cog: %s", cog_name)
+                    except Exception:
+                        log.exception("Failed to load cog %s", cog_name)
 
         # Sync commands to guild
         guild = discord.Object(id=GUILD_ID)
         self.tree.copy_global_to(guild=guild)
         await self.tree.sync(guild=guild)
-        print(f"✅ Logged in as {self.user}")
-        print("✅ Slash commands synced to your server!")
+        log.info("Logged in as %s", self.user)
+        log.info("Slash commands synced to guild %s", GUILD_ID)
 
 async def main():
     bot = MyBot()
@@ -60,5 +88,5 @@ async def main():
 if __name__ == "__main__":
     try:
         asyncio.run(main())
-    except Exception as e:
-        print(f"Error occurred: {e}")
+    except Exception:
+        log.exception("Bot stopped with an error")
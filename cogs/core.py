@@ -1,8 +1,13 @@
 import os
+import io
+import asyncio
 import discord
 import datetime
+import tracemalloc
 from discord import app_commands, ui
 from discord.ext import commands
+from typing import Literal
+from utils import profiling
 
 GUILD_ID = int(os.getenv('GUILD_ID'))
 
@@ -45,9 +50,17 @@ class HelpPaginator(ui.View):
         else:
             await interaction.response.defer() # Do nothing if already on last page
 
+def format_bytes(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
 class Core(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.last_snapshot = None # Previous tracemalloc snapshot, for diffs
 
     async def create_help_pages(self) -> list[discord.Embed]:
         embeds = []
@@ -77,7 +90,7 @@ class Core(commands.Cog):
         return embeds
 
     # --- Commands ---
-    @app_commands.command(name="help", description="Displays a list of all available commands.")
+    @app_commands.command(name="help", description="Displays a list of all available commands.", extras={"ephemeral": True})
     async def help(self, interaction: discord.Interaction):
         embeds = await self.create_help_pages()
         if not embeds:
@@ -86,7 +99,7 @@ class Core(commands.Cog):
         paginator = HelpPaginator(embeds)
         paginator.message = await interaction.response.send_message(embed=embeds[0], view=paginator, ephemeral=True)
 
-    @app_commands.command(name="serverinfo", description="Shows information about the server.")
+    @app_commands.command(name="serverinfo", description="Shows information about the server.", extras={"ephemeral": False})
     async def serverinfo(self, interaction: discord.Interaction):
         try:
             guild = interaction.guild
@@ -116,7 +129,7 @@ class Core(commands.Cog):
         except Exception as e:
             await interaction.response.send_message(f"❌ An error occurred while fetching server info: {e}", ephemeral=True)
 
-    @app_commands.command(name="userinfo", description="Shows information about a user.")
+    @app_commands.command(name="userinfo", description="Shows information about a user.", extras={"ephemeral": False})
     async def userinfo(self, interaction: discord.Interaction, member: discord.Member = None):
         member = member or interaction.user
         embed = discord.Embed(
@@ -134,7 +147,7 @@ class Core(commands.Cog):
         embed.set_footer(text=f"User ID: {member.id}")
         await interaction.response.send_message(embed=embed)
 
-    @app_commands.command(name="sync", description="Sync slash commands (owner only)")
+    @app_commands.command(name="sync", description="Sync slash commands (owner only)", extras={"ephemeral": True})
     @is_owner()
     async def sync(self, interaction: discord.Interaction):
         try:
@@ -143,6 +156,62 @@ class Core(commands.Cog):
         except Exception as e:
             await interaction.response.send_message(f"❌ Failed to sync commands: {e}", ephemeral=True)
 
+    # --- Diagnostics (owner only) ---
+    debug_group = app_commands.Group(name="debug", description="Memory and task diagnostics (owner only).")
+
+    async def send_report(self, interaction: discord.Interaction, title: str, lines: list[str], as_file: bool):
+        report = "\n".join(lines)
+        send = interaction.followup.send if interaction.response.is_done() else interaction.response.send_message
+        if as_file or len(report) > 1900:
+            file = discord.File(io.BytesIO(report.encode()), filename=f"{title.lower().replace(' ', '-')}.txt")
+            return await send(f"📄 {title}", file=file, ephemeral=True)
+        await send(f"**{title}**\n```\n{report}\n```", ephemeral=True)
+
+    @debug_group.command(name="memory", description="Shows entries and approximate size of each cog's state (owner only)", extras={"ephemeral": True})
+    @is_owner()
+    async def debug_memory(self, interaction: discord.Interaction, as_file: bool = False):
+        lines = [f"{'State':<36} {'Entries':>9} {'Approx. size':>13}"]
+        for cog_name, name, entries, size in profiling.state_report(self.bot.cogs):
+            lines.append(f"{f'{cog_name}.{name}':<36} {entries if entries is not None else '-':>9} {format_bytes(size):>13}")
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            lines.append(f"\ntracemalloc: {format_bytes(current)} traced, {format_bytes(peak)} peak")
+        await self.send_report(interaction, "Cog State", lines, as_file)
+
+    @debug_group.command(name="tracemalloc", description="Starts, snapshots or stops allocation tracing (owner only)", extras={"ephemeral": True})
+    @app_commands.describe(action="`snapshot` lists the top allocation sites, or what changed since the previous snapshot.", frames="Stack frames to record per allocation when starting.")
+    @is_owner()
+    async def debug_tracemalloc(self, interaction: discord.Interaction, action: Literal['start', 'snapshot', 'stop'], frames: app_commands.Range[int, 1, 25] = 1, as_file: bool = False):
+        if action == "start":
+            if tracemalloc.is_tracing():
+                return await interaction.response.send_message("❌ Tracing is already running.", ephemeral=True)
+            tracemalloc.start(frames)
+            self.last_snapshot = None
+            return await interaction.response.send_message(f"✅ Started tracing allocations ({frames} frame(s)).", ephemeral=True)
+
+        if action == "stop":
+            tracemalloc.stop()
+            self.last_snapshot = None
+            return await interaction.response.send_message("✅ Stopped tracing allocations.", ephemeral=True)
+
+        if not tracemalloc.is_tracing():
+            return await interaction.response.send_message("❌ Tracing is not running. Use `/debug tracemalloc start` first.", ephemeral=True)
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        snapshot = await asyncio.to_thread(profiling.take_snapshot)
+        lines = await asyncio.to_thread(profiling.compare_snapshots, snapshot, self.last_snapshot)
+        title = "Allocation Changes" if self.last_snapshot else "Top Allocations"
+        self.last_snapshot = snapshot
+        await self.send_report(interaction, title, lines or ["No allocations recorded."], as_file)
+
+    @debug_group.command(name="tasks", description="Shows running asyncio tasks grouped by coroutine (owner only)", extras={"ephemeral": True})
+    @is_owner()
+    async def debug_tasks(self, interaction: discord.Interaction, as_file: bool = False):
+        counts = profiling.task_report()
+        lines = [f"{count:>6}  {name}" for name, count in counts]
+        lines.append(f"{sum(count for _, count in counts):>6}  total")
+        await self.send_report(interaction, "Asyncio Tasks", lines, as_file)
+
     # --- Events ---
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
@@ -1,10 +1,14 @@
 import discord
 import random
-import re
+import asyncio
 import aiohttp
 import datetime
 from discord import app_commands
 from discord.ext import commands
+from utils import dice as dice_engine
+
+# Rolls that sample more dice than this are computed in a worker thread after deferring.
+HEAVY_ROLL_DICE = 100_000
 
 class Engagement(commands.Cog):
     def __init__(self, bot: commands.Bot):
@@ -15,7 +19,7 @@ class Engagement(commands.Cog):
         }
         self.number_emojis = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
 
-    @app_commands.command(name="poll", description="Creates a poll with up to 10 options.")
+    @app_commands.command(name="poll", description="Creates a poll with up to 10 options.", extras={"ephemeral": False})
     async def poll(self, interaction: discord.Interaction, question: str, option1: str, option2: str, option3: str = None, option4: str = None, option5: str = None, option6: str = None, option7: str = None, option8: str = None, option9: str = None, option10: str = None):
         options = [opt for opt in [option1, option2, option3, option4, option5, option6, option7, option8, option9, option10] if opt is not None]
         
@@ -38,7 +42,7 @@ class Engagement(commands.Cog):
         for i in range(len(options)):
             await message.add_reaction(self.number_emojis[i])
 
-    @app_commands.command(name="techfact", description="Fetches a random tech fact.")
+    @app_commands.command(name="techfact", description="Fetches a random tech fact.", extras={"ephemeral": False})
     async def techfact(self, interaction: discord.Interaction):
         await interaction.response.defer()
         async with aiohttp.ClientSession() as session:
@@ -51,33 +55,79 @@ class Engagement(commands.Cog):
                 else:
                     await interaction.followup.send("❌ Could not fetch a tech fact at this time.", ephemeral=True)
 
-    @app_commands.command(name="coinflip", description="Flips a coin.")
+    @app_commands.command(name="coinflip", description="Flips a coin.", extras={"ephemeral": False})
     async def coinflip(self, interaction: discord.Interaction):
         result = random.choice(["Heads", "Tails"])
         embed = discord.Embed(title="Coin Flip", description=f"The coin landed on **{result}**!", color=discord.Color.gold(), timestamp=datetime.datetime.utcnow())
         embed.set_thumbnail(url=self.coin_images[result])
         await interaction.response.send_message(embed=embed)
 
-    @app_commands.command(name="rolldice", description="Rolls dice in NdN format (e.g., 2d6).")
-    async def rolldice(self, interaction: discord.Interaction, dice: str):
-        match = re.match(r"(\d+)d(\d+)", dice.lower())
-        if not match:
-            return await interaction.response.send_message("❌ Invalid format! Please use NdN format (e.g., `2d6`).", ephemeral=True)
-        
-        num_dice, num_sides = int(match.group(1)), int(match.group(2))
-        if not (1 <= num_dice <= 25) or not (1 <= num_sides <= 100):
-            return await interaction.response.send_message("❌ Please use reasonable numbers for dice (1-25 dice, 1-100 sides).", ephemeral=True)
+    @app_commands.command(name="rolldice", description="Rolls dice, e.g. 2d6, 4d6kh3+2, 100d20>15, 10d6! (compounding) or 6x 4d6kh3.", extras={"ephemeral": False})
+    @app_commands.describe(dice="The dice expression to roll. `!` adds each explosion to the die that exploded.", stats="Show the mean and distribution of the expression instead of rolling it.")
+    async def rolldice(self, interaction: discord.Interaction, dice: str, stats: bool = False):
+        try:
+            expression = dice_engine.parse(dice)
+        except dice_engine.DiceError as e:
+            return await interaction.response.send_message(f"❌ {e}", ephemeral=True)
+
+        if stats:
+            try:
+                expression.stats_method()
+            except dice_engine.DiceError as e:
+                return await interaction.response.send_message(f"❌ {e}", ephemeral=True)
+            await interaction.response.defer()
+            result = await asyncio.to_thread(expression.stats)
+            return await interaction.followup.send(embed=self.create_dice_stats_embed(expression, result))
 
-        rolls = [random.randint(1, num_sides) for _ in range(num_dice)]
-        total = sum(rolls)
+        if expression.dice_per_roll * expression.repeats > HEAVY_ROLL_DICE:
+            await interaction.response.defer()
+            rolls = await asyncio.to_thread(expression.roll)
+            return await interaction.followup.send(embed=self.create_dice_roll_embed(expression, rolls))
+
+        await interaction.response.send_message(embed=self.create_dice_roll_embed(expression, expression.roll()))
+
+    def create_dice_roll_embed(self, expression: dice_engine.DiceExpression, rolls: list[tuple[int, str]]) -> discord.Embed:
+        if len(rolls) == 1:
+            total, breakdown = rolls[0]
+            description = f"**Total:** {total:,}\n**Rolls:** {breakdown}"
+        else:
+            lines = [f"**#{i}:** {total:,} — {breakdown}" for i, (total, breakdown) in enumerate(rolls, start=1)]
+            description = "\n".join(lines) + f"\n\n**Sum of all rolls:** {sum(total for total, _ in rolls):,}"
+        if len(description) > 4000: # Embed descriptions are capped at 4096 characters
+            description = "\n".join(f"**#{i}:** {total:,}" for i, (total, _) in enumerate(rolls, start=1))
+
+        return discord.Embed(
+            title=f"🎲 Dice Roll: {expression.text}"[:256],
+            description=description,
+            color=discord.Color.dark_red(),
+            timestamp=datetime.datetime.utcnow()
+        )
+
+    def create_dice_stats_embed(self, expression: dice_engine.DiceExpression, result: dict) -> discord.Embed:
+        histogram = result["histogram"]
+        peak = max(share for _, _, share in histogram) or 1
+        labels = [f"{low:,}" if low == high else f"{low:,}–{high:,}" for low, high, _ in histogram]
+        width = max(len(label) for label in labels)
+        rows = []
+        for label, (_, _, share) in zip(labels, histogram):
+            bar = "█" * round(20 * share / peak)
+            rows.append(f"{label:>{width}} {bar} {100 * share:.1f}%")
 
         embed = discord.Embed(
-            title=f"🎲 Dice Roll: {dice}",
-            description=f"**Total:** {total}\n**Rolls:** {', '.join(map(str, rolls))}",
+            title=f"📈 Dice Stats: {expression.text}"[:256],
+            description="```\n" + "\n".join(rows) + "\n```",
             color=discord.Color.dark_red(),
             timestamp=datetime.datetime.utcnow()
         )
-        await interaction.response.send_message(embed=embed)
+        embed.add_field(name="Mean", value=f"{result['mean']:,.2f}", inline=True)
+        embed.add_field(name="Std. Dev.", value=f"{result['std']:,.2f}", inline=True)
+        if result["method"] == "normal":
+            embed.add_field(name="Likely Range (±4σ)", value=f"{result['min']:,} – {result['max']:,}", inline=True)
+            embed.set_footer(text="Distribution of a single roll, normal approximation from exact per-die statistics")
+        else:
+            embed.add_field(name="Range", value=f"{result['min']:,} – {result['max']:,}", inline=True)
+            embed.set_footer(text=f"Distribution of a single roll, based on {result['trials']:,} simulated rolls")
+        return embed
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(Engagement(bot))
\ No newline at end of file
@@ -1,13 +1,242 @@
 import discord
+import bisect
+import logging
+import calendar
 import datetime
 import random
 from discord import app_commands, ui
 from discord.ext import commands, tasks
+from typing import Literal
+from utils.autocomplete import AutocompleteIndex
+from utils.edits import CoalescedEditor
+from utils.export import send_export
+
+log = logging.getLogger(__name__)
 
 # This is a simple in-memory dictionary to store events.
 # For a production bot, you would want to use a database like SQLite or PostgreSQL.
 events = {}
 
+class EventIndex:
+    """Keeps event IDs ordered by their next occurrence so range queries never sort the whole `events` dict.
+
+    Besides the main time order, each event can carry tags such as ("channel", id) or
+    ("user", id); every tag keeps its own time-ordered list, so "this channel" or
+    "events I RSVP'd to" only ever touch the matching events.
+    """
+    def __init__(self):
+        self._keys = [] # Sorted (time, message_id) pairs
+        self._times = {}
+        self._tags = {} # message_id -> set of tags
+        self._by_tag = {} # tag -> sorted (time, message_id) pairs
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, msg_id: int, time: datetime.datetime, tags=()):
+        """Inserts an event, or moves it if it is already indexed under another time."""
+        self.discard(msg_id)
+        bisect.insort(self._keys, (time, msg_id))
+        self._times[msg_id] = time
+        self._tags[msg_id] = set()
+        for tag in tags:
+            self.tag(msg_id, tag)
+
+    def tag(self, msg_id: int, tag: tuple):
+        """Adds an already indexed event to a secondary index."""
+        tags = self._tags.get(msg_id)
+        if tags is None or tag in tags:
+            return
+        tags.add(tag)
+        bisect.insort(self._by_tag.setdefault(tag, []), (self._times[msg_id], msg_id))
+
+    def discard(self, msg_id: int):
+        time = self._times.pop(msg_id, None)
+        if time is None:
+            return
+        key = (time, msg_id)
+        del self._keys[bisect.bisect_left(self._keys, key)]
+        for tag in self._tags.pop(msg_id):
+            keys = self._by_tag[tag]
+            del keys[bisect.bisect_left(keys, key)]
+            if not keys:
+                del self._by_tag[tag]
+
+    def iter_range(self, start=None, end: datetime.datetime = None, tag: tuple = None):
+        """Yields (time, message_id) pairs from `start` (a time or a (time, message_id) cursor) up to, but excluding, `end`.
+
+        With `tag`, only events carrying that tag are visited.
+        """
+        keys = self._keys if tag is None else self._by_tag.get(tag, [])
+        if isinstance(start, datetime.datetime):
+            start = (start,)
+        i = bisect.bisect_left(keys, start) if start is not None else 0
+        while i < len(keys):
+            key = keys[i]
+            if end is not None and key[0] >= end:
+                return
+            yield key
+            i += 1
+
+event_index = EventIndex()
+event_search_index = AutocompleteIndex() # Event titles, per guild, for autocomplete
+rsvp_editor = CoalescedEditor() # Batches RSVP count updates to event messages
+
+def event_tags(event: dict) -> list[tuple]:
+    """The secondary indexes an event belongs to: its guild, its channel and everyone who RSVP'd."""
+    return [("guild", event["guild_id"]), ("channel", event["channel_id"])] + [("user", user.id) for user in event["going"] + event["interested"]]
+
+def store_event(msg_id: int, event: dict):
+    """Adds or reschedules an event in the store, the time index and the autocomplete index."""
+    events[msg_id] = event
+    event_index.add(msg_id, event["time"], event_tags(event))
+    event_search_index.add(event["guild_id"], msg_id, event["title"], name=f"{event['title']} — {event['time']:%Y-%m-%d %H:%M} UTC", value=str(msg_id))
+
+def remove_event(msg_id: int):
+    event = events.pop(msg_id, None)
+    event_index.discard(msg_id)
+    if event:
+        event_search_index.remove(event["guild_id"], msg_id)
+
+# --- Recurrence ---
+
+class Recurrence:
+    """An RRULE-style recurrence rule (FREQ, INTERVAL, COUNT, UNTIL).
+
+    A recurring event is stored once with its rule; occurrences are computed on
+    demand from the series start and are never materialised into a list.
+    """
+    FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY")
+    MAX_INTERVAL = 1000
+    MAX_COUNT = 1000
+
+    def __init__(self, freq: str, interval: int = 1, count: int = None, until: datetime.datetime = None):
+        self.freq = freq
+        self.interval = interval
+        self.count = count
+        self.until = until
+
+    @classmethod
+    def parse(cls, text: str):
+        """Parses `weekly` style shorthand or `FREQ=WEEKLY;INTERVAL=2;COUNT=10`. Returns None for an empty string."""
+        text = text.strip().upper()
+        if not text:
+            return None
+
+        parts = {}
+        for i, part in enumerate(text.split(";")):
+            key, sep, value = part.partition("=")
+            if not sep and i == 0:
+                key, value = "FREQ", part
+            elif not sep:
+                raise ValueError(f"Invalid recurrence rule part `{part}`.")
+            parts[key.strip()] = value.strip()
+
+        freq = parts.pop("FREQ", None)
+        if freq not in cls.FREQUENCIES:
+            raise ValueError("Recurrence must be DAILY, WEEKLY or MONTHLY.")
+        try:
+            interval = int(parts.pop("INTERVAL", 1))
+            count = int(parts.pop("COUNT")) if "COUNT" in parts else None
+            until = datetime.datetime.strptime(parts.pop("UNTIL"), "%Y-%m-%d") + datetime.timedelta(days=1) if "UNTIL" in parts else None
+        except ValueError:
+            raise ValueError("INTERVAL and COUNT must be numbers and UNTIL must be YYYY-MM-DD.")
+        if parts:
+            raise ValueError(f"Unsupported recurrence field(s): {', '.join(parts)}.")
+        if interval < 1 or (count is not None and count < 1):
+            raise ValueError("INTERVAL and COUNT must be at least 1.")
+        if interval > cls.MAX_INTERVAL or (count is not None and count > cls.MAX_COUNT):
+            raise ValueError(f"INTERVAL and COUNT can be at most {cls.MAX_INTERVAL} and {cls.MAX_COUNT}.")
+        return cls(freq, interval, count, until)
+
+    def describe(self) -> str:
+        unit = {"DAILY": "day", "WEEKLY": "week", "MONTHLY": "month"}[self.freq]
+        text = f"Every {unit}" if self.interval == 1 else f"Every {self.interval} {unit}s"
+        if self.count is not None:
+            text += f", {self.count} times"
+        if self.until is not None:
+            text += f", until {(self.until - datetime.timedelta(days=1)):%Y-%m-%d}"
+        return text
+
+    def _nth(self, start: datetime.datetime, n: int):
+        """Returns the n-th occurrence of the series, or None if it falls on a day that does not exist (e.g. 31 February).
+
+        Raises OverflowError once the occurrence would be past `datetime.max`.
+        """
+        if self.freq == "MONTHLY":
+            year, month = divmod(start.month - 1 + n * self.interval, 12)
+            year += start.year
+            if year > datetime.MAXYEAR:
+                raise OverflowError("occurrence is past datetime.max")
+            if start.day > calendar.monthrange(year, month + 1)[1]:
+                return None
+            return start.replace(year=year, month=month + 1)
+        step = datetime.timedelta(days=self.interval * (7 if self.freq == "WEEKLY" else 1))
+        return start + n * step
+
+    def occurrences(self, start: datetime.datetime, after: datetime.datetime, exdates=()):
+        """Lazily yields occurrences strictly after `after`, skipping excluded dates.
+
+        Like RRULE, days that do not exist in a month are not counted towards COUNT;
+        only that case needs a scan from the series start, everything else jumps straight
+        to the first occurrence after `after`.
+        """
+        if after < start or (self.count is not None and self.freq == "MONTHLY" and start.day > 28):
+            n = 0
+        elif self.freq == "MONTHLY":
+            n = ((after.year - start.year) * 12 + after.month - start.month) // self.interval
+        else:
+            step = datetime.timedelta(days=self.interval * (7 if self.freq == "WEEKLY" else 1))
+            n = (after - start) // step
+
+        emitted = n
+        while self.count is None or emitted < self.count:
+            try:
+                occurrence = self._nth(start, n)
+            except OverflowError:
+                return # The series runs on past the end of the calendar
+            n += 1
+            if occurrence is None:
+                continue
+            emitted += 1
+            if occurrence <= after or occurrence.date() in exdates:
+                continue
+            if self.until is not None and occurrence >= self.until:
+                return
+            yield occurrence
+
+def advance_event(event: dict, now: datetime.datetime) -> bool:
+    """Moves a recurring event on to its next occurrence. Returns False when the series has ended."""
+    if not event["rule"]:
+        return False
+    next_time = next(event["rule"].occurrences(event["start"], now, event["exdates"]), None)
+    if next_time is None:
+        return False
+    event["time"] = next_time
+    event["reminders_sent"] = []
+    if event["rsvp_scope"] == "occurrence":
+        event["going"] = []
+        event["interested"] = []
+    return True
+
+def create_event_embed(event: dict) -> discord.Embed:
+    repeats = f"\n**Repeats:** {event['rule'].describe()}" if event["rule"] else ""
+    embed = discord.Embed(
+        title=f"🎉 New Event: {event['title']}",
+        description=f"**Description:**\n{event['description']}\n\n**When:** <t:{int(event['time'].timestamp())}:F>{repeats}\n**Where:** {event['location']}",
+        color=discord.Color.purple(),
+        timestamp=event["created_at"]
+    )
+    embed.add_field(name="✅ Going", value=str(len(event["going"])), inline=True)
+    embed.add_field(name="🤔 Interested", value=str(len(event["interested"])), inline=True)
+    embed.set_footer(text=f"Event created by {event['created_by']}", icon_url=event["created_by_icon"])
+    return embed
+
+def render_event_message(msg_id: int):
+    """Renders the current state of an event message for the edit queue, or None if the event is gone."""
+    event = events.get(msg_id)
+    return {"embed": create_event_embed(event)} if event else None
+
 # --- UI Components ---
 
 class EventRSVPView(ui.View):
@@ -21,6 +250,7 @@ class EventRSVPView(ui.View):
             return await interaction.response.send_message("This event seems to have expired or been canceled.", ephemeral=True)
 
         user = interaction.user
+        log.info("RSVP %s for event %s", new_status, event_id, extra={"sample": "rsvp", "guild_id": interaction.guild_id, "user_id": user.id})
         going_list = events[event_id]["going"]
         interested_list = events[event_id]["interested"]
 
@@ -37,6 +267,10 @@ class EventRSVPView(ui.View):
             interested_list.append(user)
             await interaction.response.send_message("You are now marked as **interested**.", ephemeral=True)
 
+        event_index.tag(event_id, ("user", user.id))
+
+        rsvp_editor.request(interaction.message, lambda: render_event_message(event_id))
+
     @ui.button(label="✅ Going", style=discord.ButtonStyle.green, custom_id="event_rsvp_going_persistent")
     async def going(self, interaction: discord.Interaction, button: ui.Button):
         await self.handle_rsvp(interaction, "going")
@@ -47,10 +281,15 @@ class EventRSVPView(ui.View):
 
 class EventModal(ui.Modal, title="Create a New Event"):
     """A modal for users to input event details."""
-    title_input = ui.TextInput(label="Event Title", style=discord.TextStyle.short)
+    title_input = ui.TextInput(label="Event Title", style=discord.TextStyle.short, max_length=100)
     description_input = ui.TextInput(label="Description", style=discord.TextStyle.long)
     datetime_input = ui.TextInput(label="Date and Time (YYYY-MM-DD HH:MM UTC)", placeholder="e.g., 2025-12-25 18:00")
     location_input = ui.TextInput(label="Location", style=discord.TextStyle.short)
+    recurrence_input = ui.TextInput(label="Repeats (optional)", placeholder="e.g., weekly or FREQ=MONTHLY;INTERVAL=1;COUNT=6", required=False)
+
+    def __init__(self, rsvp_scope: str = "series"):
+        super().__init__()
+        self.rsvp_scope = rsvp_scope
 
     async def on_submit(self, interaction: discord.Interaction):
         try:
@@ -61,25 +300,104 @@ class EventModal(ui.Modal, title="Create a New Event"):
         if event_time < datetime.datetime.utcnow():
             return await interaction.response.send_message("❌ You cannot create an event in the past.", ephemeral=True)
 
-        embed = discord.Embed(
-            title=f"🎉 New Event: {self.title_input}",
-            description=f"**Description:**\n{self.description_input}\n\n**When:** <t:{int(event_time.timestamp())}:F>\n**Where:** {self.location_input}",
-            color=discord.Color.purple(),
-            timestamp=datetime.datetime.utcnow()
-        )
-        embed.set_footer(text=f"Event created by {interaction.user.display_name}", icon_url=interaction.user.avatar.url if interaction.user.avatar else None)
-
-        await interaction.response.send_message("Event created!", ephemeral=True)
-        event_message = await interaction.channel.send(embed=embed, view=EventRSVPView())
+        try:
+            rule = Recurrence.parse(str(self.recurrence_input))
+        except ValueError as e:
+            return await interaction.response.send_message(f"❌ {e}", ephemeral=True)
+        if rule and rule.until is not None and rule.until <= event_time:
+            return await interaction.response.send_message("❌ UNTIL must not be before the first occurrence.", ephemeral=True)
 
-        events[event_message.id] = {
+        event = {
             "title": str(self.title_input),
-            "time": event_time,
+            "description": str(self.description_input), "location": str(self.location_input),
+            "time": event_time, "start": event_time,
+            "rule": rule, "exdates": set(), "rsvp_scope": self.rsvp_scope,
             "guild_id": interaction.guild.id,
             "channel_id": interaction.channel.id,
+            "created_by": interaction.user.display_name,
+            "created_by_icon": interaction.user.avatar.url if interaction.user.avatar else None,
+            "created_at": datetime.datetime.utcnow(),
             "going": [], "interested": [], "reminders_sent": []
         }
 
+        await interaction.response.send_message("Event created!", ephemeral=True)
+        event_message = await interaction.channel.send(embed=create_event_embed(event), view=EventRSVPView())
+        store_event(event_message.id, event)
+
+class EventListPaginator(ui.View):
+    """Pages through the event index lazily; only the page being shown is ever read."""
+    PAGE_SIZE = 10
+
+    def __init__(self, tag: tuple, matches, end: datetime.datetime = None):
+        super().__init__(timeout=180) # Timeout after 3 minutes of inactivity
+        self.tag = tag
+        self.matches = matches
+        self.end = end
+        self.cursors = [None] # Index cursor at the start of each visited page
+        self.current_page = 0
+        self.has_next = False
+
+    def build_page(self):
+        """Reads one page from the index. Returns None if the first page is empty."""
+        entries = []
+        next_cursor = None
+        for time, msg_id in event_index.iter_range(self.cursors[self.current_page], self.end, self.tag):
+            event = events.get(msg_id)
+            if not event or not self.matches(event):
+                continue
+            if len(entries) == self.PAGE_SIZE:
+                next_cursor = (time, msg_id)
+                break
+            entries.append((msg_id, event))
+
+        if not entries and self.current_page == 0:
+            return None
+
+        self.has_next = next_cursor is not None
+        if self.has_next and len(self.cursors) == self.current_page + 1:
+            self.cursors.append(next_cursor)
+        self.update_buttons()
+
+        embed = discord.Embed(title="Upcoming Events", color=discord.Color.dark_blue(), timestamp=datetime.datetime.utcnow())
+        for msg_id, event in entries:
+            embed.add_field(
+                name=event["title"],
+                value=f"**Event ID:** `{msg_id}`\n<t:{int(event['time'].timestamp())}:F> - [Jump to Event](https://discord.com/channels/{event['guild_id']}/{event['channel_id']}/{msg_id})",
+                inline=False
+            )
+        embed.set_footer(text=f"Page {self.current_page + 1}")
+        return embed
+
+    def update_buttons(self):
+        self.children[0].disabled = (self.current_page == 0) # Previous button
+        self.children[1].disabled = not self.has_next # Next button
+
+    async def on_timeout(self):
+        for item in self.children:
+            item.disabled = True
+        await self.message.edit(view=self)
+
+    async def show_page(self, interaction: discord.Interaction, page: int):
+        self.current_page = page
+        embed = self.build_page()
+        if embed is None: # Every listed event has since ended or been canceled
+            embed = discord.Embed(title="Upcoming Events", description="No upcoming events left.", color=discord.Color.dark_blue())
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    @ui.button(label="Previous", style=discord.ButtonStyle.blurple)
+    async def previous_button(self, interaction: discord.Interaction, button: ui.Button):
+        if self.current_page > 0:
+            await self.show_page(interaction, self.current_page - 1)
+        else:
+            await interaction.response.defer() # Do nothing if already on first page
+
+    @ui.button(label="Next", style=discord.ButtonStyle.blurple)
+    async def next_button(self, interaction: discord.Interaction, button: ui.Button):
+        if self.has_next:
+            await self.show_page(interaction, self.current_page + 1)
+        else:
+            await interaction.response.defer() # Do nothing if already on last page
+
 # --- Main Cog Class ---
 
 class Events(commands.Cog):
@@ -90,15 +408,65 @@ class Events(commands.Cog):
 
     def cog_unload(self):
         self.check_reminders.cancel()
+        rsvp_editor.close()
+
+    def debug_state(self) -> dict:
+        """In-memory state reported by `/debug memory`."""
+        return {"events": events, "event_index": event_index, "event_search_index": event_search_index, "rsvp_editor.pending": rsvp_editor.pending}
+
+    def refresh_event_message(self, msg_id: int, event: dict):
+        """Queues an update of the event message after its time or RSVPs changed outside a button click."""
+        channel = self.bot.get_channel(event["channel_id"])
+        if channel:
+            rsvp_editor.request(channel.get_partial_message(msg_id), lambda: render_event_message(msg_id))
 
     event_group = app_commands.Group(name="event", description="Commands for event management.")
 
-    @event_group.command(name="create", description="Creates a new event.")
+    @event_group.command(name="create", description="Creates a new event.", extras={"ephemeral": True})
+    @app_commands.describe(rsvp_scope="For recurring events: keep RSVPs for the whole series or reset them after each occurrence.")
     @app_commands.checks.has_permissions(manage_events=True)
-    async def event_create(self, interaction: discord.Interaction):
-        await interaction.response.send_modal(EventModal())
+    async def event_create(self, interaction: discord.Interaction, rsvp_scope: Literal['series', 'occurrence'] = 'series'):
+        await interaction.response.send_modal(EventModal(rsvp_scope))
 
-    @event_group.command(name="cancel", description="Cancels an event.")
+    @event_group.command(name="skip", description="Skips one occurrence of a recurring event.", extras={"ephemeral": True})
+    @app_commands.describe(date="The date of the occurrence to skip (YYYY-MM-DD).")
+    @app_commands.checks.has_permissions(manage_events=True)
+    async def event_skip(self, interaction: discord.Interaction, event_message_id: str, date: str):
+        try:
+            msg_id = int(event_message_id)
+        except ValueError:
+            return await interaction.response.send_message("❌ Invalid message ID.", ephemeral=True)
+        try:
+            skip_date = datetime.datetime.strptime(date, "%Y-%m-%d").date()
+        except ValueError:
+            return await interaction.response.send_message("❌ Invalid date format. Please use YYYY-MM-DD.", ephemeral=True)
+
+        event = events.get(msg_id)
+        if not event:
+            return await interaction.response.send_message("❌ No event found with that message ID.", ephemeral=True)
+        if not event["rule"]:
+            return await interaction.response.send_message("❌ This event does not repeat.", ephemeral=True)
+
+        # Only dates the series actually lands on (from the current occurrence onwards) can be skipped.
+        if skip_date < event["time"].date():
+            return await interaction.response.send_message(f"❌ This event has no upcoming occurrence on {skip_date}.", ephemeral=True)
+        day_start = datetime.datetime.combine(skip_date, datetime.time())
+        occurrence = next(event["rule"].occurrences(event["start"], day_start - datetime.timedelta(microseconds=1)), None)
+        if occurrence is None or occurrence.date() != skip_date or occurrence < event["time"]:
+            return await interaction.response.send_message(f"❌ This event has no upcoming occurrence on {skip_date}.", ephemeral=True)
+        if skip_date in event["exdates"]:
+            return await interaction.response.send_message(f"❌ The occurrence on {skip_date} is already skipped.", ephemeral=True)
+
+        event["exdates"].add(skip_date)
+        if event["time"].date() == skip_date:
+            if not advance_event(event, event["time"]):
+                remove_event(msg_id)
+                return await interaction.response.send_message("✅ Occurrence skipped. That was the last one, so the event has ended.", ephemeral=True)
+            store_event(msg_id, event)
+            self.refresh_event_message(msg_id, event)
+        await interaction.response.send_message(f"✅ Occurrence on {skip_date} skipped. Next occurrence: <t:{int(event['time'].timestamp())}:F>", ephemeral=True)
+
+    @event_group.command(name="cancel", description="Cancels an event.", extras={"ephemeral": True})
     @app_commands.checks.has_permissions(manage_events=True)
     async def event_cancel(self, interaction: discord.Interaction, event_message_id: str):
         try:
@@ -107,7 +475,7 @@ class Events(commands.Cog):
             return await interaction.response.send_message("❌ Invalid message ID.", ephemeral=True)
 
         if msg_id in events:
-            del events[msg_id]
+            remove_event(msg_id)
             try:
                 msg = await interaction.channel.fetch_message(msg_id)
                 await msg.delete()
@@ -117,28 +485,41 @@ class Events(commands.Cog):
         else:
             await interaction.response.send_message("❌ No event found with that message ID.", ephemeral=True)
 
-    @event_group.command(name="list", description="Lists all upcoming events.")
-    async def event_list(self, interaction: discord.Interaction):
-        if not events:
+    @event_group.command(name="list", description="Lists all upcoming events.", extras={"ephemeral": True})
+    @app_commands.describe(days="Only show events in the next N days.", channel="Only show events posted in this channel.", mine="Only show events you RSVP'd to.")
+    async def event_list(self, interaction: discord.Interaction, days: app_commands.Range[int, 1, 365] = None, channel: discord.TextChannel = None, mine: bool = False):
+        guild_id, user_id = interaction.guild.id, interaction.user.id
+        channel_id = channel.id if channel else None
+
+        # Walk the narrowest secondary index; the remaining filters are O(1) checks per event.
+        if mine:
+            tag = ("user", user_id)
+        elif channel_id is not None:
+            tag = ("channel", channel_id)
+        else:
+            tag = ("guild", guild_id)
+
+        def matches(event: dict) -> bool:
+            if event["guild_id"] != guild_id:
+                return False
+            return channel_id is None or event["channel_id"] == channel_id
+
+        end = datetime.datetime.utcnow() + datetime.timedelta(days=days) if days else None
+        paginator = EventListPaginator(tag, matches, end)
+        embed = paginator.build_page()
+        if embed is None:
             embed = discord.Embed(
                 title="No Upcoming Events",
-                description="There are currently no scheduled events.\n*Note: Events are cleared when the bot restarts.*",
+                description="There are currently no scheduled events matching your filters.\n*Note: Events are cleared when the bot restarts.*",
                 color=discord.Color.light_grey(),
                 timestamp=datetime.datetime.utcnow()
             )
             return await interaction.response.send_message(embed=embed, ephemeral=True)
 
-        embed = discord.Embed(title="Upcoming Events", color=discord.Color.dark_blue(), timestamp=datetime.datetime.utcnow())
-        sorted_events = sorted(events.items(), key=lambda item: item[1]['time'])
-        for msg_id, event in sorted_events:
-            embed.add_field(
-                name=event["title"],
-                value=f"**Event ID:** `{msg_id}`\n<t:{int(event['time'].timestamp())}:F> - [Jump to Event](https://discord.com/channels/{interaction.guild.id}/{event['channel_id']}/{msg_id})",
-                inline=False
-            )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=embed, view=paginator, ephemeral=True)
+        paginator.message = await interaction.original_response()
 
-    @event_group.command(name="details", description="Shows the RSVP details for an event.")
+    @event_group.command(name="details", description="Shows the RSVP details for an event.", extras={"ephemeral": True})
     async def event_details(self, interaction: discord.Interaction, event_message_id: str):
         try:
             msg_id = int(event_message_id)
@@ -155,6 +536,9 @@ class Events(commands.Cog):
             color=discord.Color.blue(),
             timestamp=datetime.datetime.utcnow()
         )
+        if event["rule"]:
+            scope = "the whole series" if event["rsvp_scope"] == "series" else "the next occurrence"
+            embed.description = f"**Repeats:** {event['rule'].describe()}\n**Next:** <t:{int(event['time'].timestamp())}:F>\nRSVPs apply to {scope}."
 
         going_users = "\n".join([user.mention for user in event["going"]]) or "No one yet."
         interested_users = "\n".join([user.mention for user in event["interested"]]) or "No one yet."
@@ -164,15 +548,51 @@ class Events(commands.Cog):
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
+    @event_group.command(name="export", description="Exports an event's RSVPs as a CSV or JSON file.", extras={"ephemeral": True})
+    @app_commands.describe(compress="Gzip the file, for very large events.")
+    @app_commands.checks.has_permissions(manage_events=True)
+    async def event_export(self, interaction: discord.Interaction, event_message_id: str, file_format: Literal['csv', 'json'] = 'csv', compress: bool = False):
+        try:
+            msg_id = int(event_message_id)
+        except ValueError:
+            return await interaction.response.send_message("❌ Invalid message ID.", ephemeral=True)
+
+        if msg_id not in events:
+            return await interaction.response.send_message("❌ No event found with that message ID.", ephemeral=True)
+
+        event = events[msg_id]
+        going, interested = list(event["going"]), list(event["interested"]) # Snapshot; RSVPs can change while exporting
+
+        def rows():
+            for status, users in (("going", going), ("interested", interested)):
+                for user in users:
+                    yield status, str(user.id), user.name, user.display_name
+
+        await send_export(interaction, f"event-{msg_id}-rsvps", ["status", "user_id", "username", "display_name"], rows(), file_format, compress)
+
+    @event_cancel.autocomplete("event_message_id")
+    @event_details.autocomplete("event_message_id")
+    @event_export.autocomplete("event_message_id")
+    @event_skip.autocomplete("event_message_id")
+    async def event_id_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+        return event_search_index.search(interaction.guild_id, current)
+
     @tasks.loop(minutes=1)
     async def check_reminders(self):
         """Periodically checks and sends reminders for upcoming events."""
         now = datetime.datetime.utcnow()
-        for event_id, event in list(events.items()):
-            if event["time"] < now:
-                del events[event_id]
+        # Only events inside the 24 hour reminder window can need work this tick.
+        for _, event_id in list(event_index.iter_range(end=now + datetime.timedelta(hours=24))):
+            event = events.get(event_id)
+            if event is None: # Canceled while an earlier reminder was being sent
                 continue
-            
+            if event["time"] < now:
+                if not advance_event(event, now):
+                    remove_event(event_id)
+                    continue
+                store_event(event_id, event)
+                self.refresh_event_message(event_id, event)
+
             time_diff_24h = event["time"] - datetime.timedelta(hours=24)
             time_diff_1h = event["time"] - datetime.timedelta(hours=1)
 
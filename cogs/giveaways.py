@@ -1,9 +1,16 @@
 import discord
 import asyncio
 import random
+import logging
 import datetime
 from discord import app_commands
 from discord.ext import commands
+from utils.log import interaction_context
+from utils.autocomplete import AutocompleteIndex
+from utils.export import send_export
+from typing import Literal
+
+log = logging.getLogger(__name__)
 
 def parse_duration(duration_str: str) -> int:
     unit = duration_str[-1].lower()
@@ -19,10 +26,15 @@ class Giveaways(commands.Cog):
         self.bot = bot
         self.completed_giveaways = {}
         self.active_giveaways = {}
+        self.completed_index = AutocompleteIndex() # Prizes of completed giveaways, per guild
+
+    def debug_state(self) -> dict:
+        """In-memory state reported by `/debug memory`."""
+        return {"active_giveaways": self.active_giveaways, "completed_giveaways": self.completed_giveaways, "completed_index": self.completed_index}
 
     giveaway_group = app_commands.Group(name="giveaway", description="Commands for managing giveaways.")
 
-    @giveaway_group.command(name="start", description="Starts a giveaway.")
+    @giveaway_group.command(name="start", description="Starts a giveaway.", extras={"ephemeral": True})
     @app_commands.checks.has_permissions(manage_guild=True)
     async def giveaway_start(self, interaction: discord.Interaction, duration: str, winners: app_commands.Range[int, 1, None], prize: str):
         try:
@@ -71,6 +83,7 @@ class Giveaways(commands.Cog):
         reaction = discord.utils.get(updated_message.reactions, emoji="🎉")
         participants = [user async for user in reaction.users() if not user.bot]
         self.completed_giveaways[updated_message.id] = participants
+        self.completed_index.add(interaction.guild.id, updated_message.id, prize, name=f"{prize} (ended {datetime.datetime.utcnow():%Y-%m-%d})", value=str(updated_message.id))
 
         if giveaway_message.id in self.active_giveaways:
             del self.active_giveaways[giveaway_message.id]
@@ -91,7 +104,7 @@ class Giveaways(commands.Cog):
         )
         await updated_message.reply(embed=result_embed)
 
-    @giveaway_group.command(name="reroll", description="Rerolls a completed giveaway.")
+    @giveaway_group.command(name="reroll", description="Rerolls a completed giveaway.", extras={"ephemeral": False})
     @app_commands.checks.has_permissions(manage_guild=True)
     async def giveaway_reroll(self, interaction: discord.Interaction, message_id: str):
         try:
@@ -116,7 +129,28 @@ class Giveaways(commands.Cog):
         )
         await interaction.response.send_message(embed=embed)
 
-    @giveaway_group.command(name="list", description="Lists all active giveaways.")
+    @giveaway_group.command(name="export", description="Exports the participants of a completed giveaway as a CSV or JSON file.", extras={"ephemeral": True})
+    @app_commands.describe(compress="Gzip the file, for very large giveaways.")
+    @app_commands.checks.has_permissions(manage_guild=True)
+    async def giveaway_export(self, interaction: discord.Interaction, message_id: str, file_format: Literal['csv', 'json'] = 'csv', compress: bool = False):
+        try:
+            msg_id = int(message_id)
+        except ValueError:
+            return await interaction.response.send_message("❌ Invalid message ID.", ephemeral=True)
+
+        if msg_id not in self.completed_giveaways:
+            return await interaction.response.send_message("❌ This is not a completed giveaway message ID or it is too old.", ephemeral=True)
+
+        participants = self.completed_giveaways[msg_id]
+        rows = ((str(user.id), user.name) for user in participants) # The participant list is never modified after the giveaway ends
+        await send_export(interaction, f"giveaway-{msg_id}-participants", ["user_id", "username"], rows, file_format, compress)
+
+    @giveaway_reroll.autocomplete("message_id")
+    @giveaway_export.autocomplete("message_id")
+    async def giveaway_reroll_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+        return self.completed_index.search(interaction.guild_id, current)
+
+    @giveaway_group.command(name="list", description="Lists all active giveaways.", extras={"ephemeral": True})
     async def giveaway_list(self, interaction: discord.Interaction):
         if not self.active_giveaways:
             embed = discord.Embed(
@@ -141,6 +175,7 @@ class Giveaways(commands.Cog):
             await interaction.response.send_message("❌ You do not have the `Manage Server` permission to use this command.", ephemeral=True)
         else:
             await interaction.response.send_message(f"❌ An unexpected error occurred: {error}", ephemeral=True)
+            log.error("Giveaway command failed", exc_info=getattr(error, "original", error), extra=interaction_context(interaction))
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(Giveaways(bot))
\ No newline at end of file
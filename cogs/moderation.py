@@ -1,7 +1,11 @@
 import discord
+import logging
 import datetime
 from discord import app_commands
 from discord.ext import commands
+from utils.log import interaction_context
+
+log = logging.getLogger(__name__)
 
 class Moderation(commands.Cog):
     def __init__(self, bot: commands.Bot):
@@ -19,7 +23,7 @@ class Moderation(commands.Cog):
         embed.set_footer(text=f"User ID: {user.id}")
         return embed
 
-    @app_commands.command(name="kick", description="Kicks a member from the server.")
+    @app_commands.command(name="kick", description="Kicks a member from the server.", extras={"ephemeral": False})
     @app_commands.checks.has_permissions(kick_members=True)
     async def kick(self, interaction: discord.Interaction, member: discord.Member, reason: str = "No reason provided."):
         if member.top_role >= interaction.user.top_role:
@@ -34,7 +38,7 @@ class Moderation(commands.Cog):
         embed = await self.create_mod_log_embed(interaction, "Kick", member, reason, discord.Color.orange())
         await interaction.response.send_message(embed=embed)
 
-    @app_commands.command(name="ban", description="Bans a member from the server.")
+    @app_commands.command(name="ban", description="Bans a member from the server.", extras={"ephemeral": False})
     @app_commands.checks.has_permissions(administrator=True)
     async def ban(self, interaction: discord.Interaction, member: discord.Member, reason: str = "No reason provided."):
         if member.top_role >= interaction.user.top_role:
@@ -49,7 +53,7 @@ class Moderation(commands.Cog):
         embed = await self.create_mod_log_embed(interaction, "Ban", member, reason, discord.Color.red())
         await interaction.response.send_message(embed=embed)
 
-    @app_commands.command(name="unban", description="Unbans a user from the server.")
+    @app_commands.command(name="unban", description="Unbans a user from the server.", extras={"ephemeral": False})
     @app_commands.checks.has_permissions(administrator=True)
     async def unban(self, interaction: discord.Interaction, user_id: str, reason: str = "No reason provided."):
         try:
@@ -64,7 +68,7 @@ class Moderation(commands.Cog):
         except discord.NotFound:
             await interaction.response.send_message(f"❌ User {user.name} is not banned.", ephemeral=True)
 
-    @app_commands.command(name="softban", description="Bans and then immediately unbans a member to delete their messages.")
+    @app_commands.command(name="softban", description="Bans and then immediately unbans a member to delete their messages.", extras={"ephemeral": False})
     @app_commands.checks.has_permissions(administrator=True)
     async def softban(self, interaction: discord.Interaction, member: discord.Member, reason: str = "Message cleanup."):
         if member.top_role >= interaction.user.top_role:
@@ -76,7 +80,7 @@ class Moderation(commands.Cog):
         embed = await self.create_mod_log_embed(interaction, "Softban", member, reason, discord.Color.dark_red())
         await interaction.response.send_message(embed=embed)
 
-    @app_commands.command(name="purge", description="Deletes a specified number of messages.")
+    @app_commands.command(name="purge", description="Deletes a specified number of messages.", extras={"ephemeral": True})
     @app_commands.checks.has_permissions(manage_messages=True)
     async def purge(self, interaction: discord.Interaction, amount: app_commands.Range[int, 1, 100]):
         await interaction.response.defer(ephemeral=True)
@@ -89,10 +93,10 @@ class Moderation(commands.Cog):
             await interaction.response.send_message("❌ You do not have the required permissions to use this command.", ephemeral=True)
         elif isinstance(error, app_commands.errors.CommandInvokeError):
             await interaction.response.send_message("❌ An error occurred while executing the command.", ephemeral=True)
-            print(error.original)
+            log.error("Moderation command failed", exc_info=error.original, extra=interaction_context(interaction))
         else:
             await interaction.response.send_message("❌ An unexpected error occurred.", ephemeral=True)
-            print(error)
+            log.error("Moderation command error: %s", error, extra=interaction_context(interaction))
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(Moderation(bot))
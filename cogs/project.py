@@ -3,17 +3,24 @@ import datetime
 from discord import app_commands, ui
 from discord.ext import commands
 from typing import Literal
+from utils.autocomplete import AutocompleteIndex
+from utils.export import send_export
 
 projects = {}
+project_index = AutocompleteIndex() # Names of active (non-archived) projects, per guild
 
 class ProjectModule(commands.Cog, name="Project"):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
+    def debug_state(self) -> dict:
+        """In-memory state reported by `/debug memory`."""
+        return {"projects": projects, "project_index": project_index}
+
     project_group = app_commands.Group(name="project", description="Commands for project management")
     task_group = app_commands.Group(name="task", description="Commands for task management")
 
-    @project_group.command(name="create", description="Creates a new project.")
+    @project_group.command(name="create", description="Creates a new project.", extras={"ephemeral": True})
     @app_commands.checks.has_permissions(manage_channels=True, manage_roles=True)
     async def project_create(self, interaction: discord.Interaction, name: str, description: str = None):
         project_role = await interaction.guild.create_role(name=f"Project: {name}")
@@ -31,10 +38,11 @@ class ProjectModule(commands.Cog, name="Project"):
             "channel_id": project_channel.id, "role_id": project_role.id,
             "tasks": [], "archived": False
         }
+        project_index.add(interaction.guild.id, name, name)
         await self.update_project_embed(interaction.guild, name)
         await interaction.response.send_message(f"✅ Project '{name}' created! Channel: {project_channel.mention}", ephemeral=True)
 
-    @project_group.command(name="adduser", description="Adds a user to a project.")
+    @project_group.command(name="adduser", description="Adds a user to a project.", extras={"ephemeral": True})
     @app_commands.checks.has_permissions(manage_roles=True)
     async def project_adduser(self, interaction: discord.Interaction, project_name: str, user: discord.Member):
         if project_name not in projects: return await interaction.response.send_message("❌ Project not found.", ephemeral=True)
@@ -42,13 +50,14 @@ class ProjectModule(commands.Cog, name="Project"):
         await user.add_roles(project_role)
         await interaction.response.send_message(f"✅ Added {user.mention} to '{project_name}'.", ephemeral=True)
 
-    @project_group.command(name="archive", description="Archives a project.")
+    @project_group.command(name="archive", description="Archives a project.", extras={"ephemeral": True})
     @app_commands.checks.has_permissions(manage_channels=True, manage_roles=True)
     async def project_archive(self, interaction: discord.Interaction, project_name: str):
         if project_name not in projects: return await interaction.response.send_message("❌ Project not found.", ephemeral=True)
         project = projects[project_name]
         project["status"] = "Archived"
         project["archived"] = True
+        project_index.remove(interaction.guild.id, project_name)
         
         channel = interaction.guild.get_channel(project["channel_id"])
         role = interaction.guild.get_role(project["role_id"])
@@ -59,14 +68,14 @@ class ProjectModule(commands.Cog, name="Project"):
         await self.update_project_embed(interaction.guild, project_name)
         await interaction.response.send_message(f"✅ Project '{project_name}' has been archived.", ephemeral=True)
 
-    @project_group.command(name="update", description="Updates a project's details.")
+    @project_group.command(name="update", description="Updates a project's details.", extras={"ephemeral": True})
     async def project_update(self, interaction: discord.Interaction, project_name: str, field: Literal['description', 'status'], new_value: str):
         if project_name not in projects: return await interaction.response.send_message("❌ Project not found.", ephemeral=True)
         projects[project_name][field] = new_value
         await self.update_project_embed(interaction.guild, project_name)
         await interaction.response.send_message(f"✅ Project '{project_name}' has been updated.", ephemeral=True)
 
-    @task_group.command(name="add", description="Adds a task to a project.")
+    @task_group.command(name="add", description="Adds a task to a project.", extras={"ephemeral": True})
     async def task_add(self, interaction: discord.Interaction, project_name: str, task_description: str):
         if project_name not in projects: return await interaction.response.send_message("❌ Project not found.", ephemeral=True)
         task_id = len(projects[project_name]["tasks"]) + 1
@@ -74,7 +83,7 @@ class ProjectModule(commands.Cog, name="Project"):
         await self.update_project_embed(interaction.guild, project_name)
         await interaction.response.send_message(f"✅ Task added to '{project_name}'.", ephemeral=True)
 
-    @task_group.command(name="complete", description="Marks a task as complete.")
+    @task_group.command(name="complete", description="Marks a task as complete.", extras={"ephemeral": True})
     async def task_complete(self, interaction: discord.Interaction, project_name: str, task_id: int):
         if project_name not in projects: return await interaction.response.send_message("❌ Project not found.", ephemeral=True)
         task = next((t for t in projects[project_name]["tasks"] if t["id"] == task_id), None)
@@ -83,6 +92,25 @@ class ProjectModule(commands.Cog, name="Project"):
         await self.update_project_embed(interaction.guild, project_name)
         await interaction.response.send_message(f"✅ Task {task_id} in '{project_name}' marked as complete.", ephemeral=True)
 
+    @project_group.command(name="export", description="Exports a project's task list as a CSV or JSON file.", extras={"ephemeral": True})
+    @app_commands.describe(compress="Gzip the file, for very large task lists.")
+    async def project_export(self, interaction: discord.Interaction, project_name: str, file_format: Literal['csv', 'json'] = 'csv', compress: bool = False):
+        if project_name not in projects: return await interaction.response.send_message("❌ Project not found.", ephemeral=True)
+        project_role = interaction.guild.get_role(projects[project_name]["role_id"])
+        if project_role not in interaction.user.roles and not interaction.user.guild_permissions.manage_roles:
+            return await interaction.response.send_message("❌ Only members of this project can export its tasks.", ephemeral=True)
+        tasks = [(t["id"], t["description"], t["completed"]) for t in projects[project_name]["tasks"]] # Snapshot; tasks can change while exporting
+        await send_export(interaction, f"project-{project_name}-tasks", ["task_id", "description", "completed"], iter(tasks), file_format, compress)
+
+    @project_adduser.autocomplete("project_name")
+    @project_export.autocomplete("project_name")
+    @project_archive.autocomplete("project_name")
+    @project_update.autocomplete("project_name")
+    @task_add.autocomplete("project_name")
+    @task_complete.autocomplete("project_name")
+    async def project_name_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+        return project_index.search(interaction.guild_id, current)
+
     async def update_project_embed(self, guild: discord.Guild, project_name: str):
         project = projects.get(project_name)
         if not project: return
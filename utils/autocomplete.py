@@ -0,0 +1,85 @@
+import bisect
+import difflib
+from discord import app_commands
+
+MAX_CHOICES = 25           # Discord shows at most 25 autocomplete choices
+MAX_SUBSTRING_SCAN = 5_000 # Entries checked for substring matches
+MAX_FUZZY_SCAN = 2_000     # Entries checked for typo-tolerant matches
+MAX_LABEL = 100            # Characters of a label that are indexed; word suffixes grow with its square
+
+class AutocompleteIndex:
+    """A per-guild prefix index for app-command autocomplete.
+
+    Every word of an entry's label is kept in a sorted array, so "night" finds
+    "Game Night" with a single bisect. Entries are added and removed incrementally
+    as the things they point at are created, archived or cancelled.
+    """
+    def __init__(self):
+        self._keys = {} # guild_id -> sorted list of (word suffix, entry_id)
+        self._entries = {} # guild_id -> {entry_id: (display name, value, keys)}
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._entries.values())
+
+    @staticmethod
+    def _suffixes(label: str) -> list[str]:
+        words = label[:MAX_LABEL].casefold().split()
+        return list(dict.fromkeys(" ".join(words[i:]) for i in range(len(words))))
+
+    def add(self, guild_id: int, entry_id, label: str, name: str = None, value: str = None):
+        """Indexes `label`. `name` is what users see (defaults to the label) and `value` is what the command receives."""
+        self.remove(guild_id, entry_id)
+        suffixes = self._suffixes(label)
+        if not suffixes:
+            return # Blank labels have nothing to match and no usable choice name
+        keys = self._keys.setdefault(guild_id, [])
+        for suffix in suffixes:
+            bisect.insort(keys, (suffix, entry_id))
+        self._entries.setdefault(guild_id, {})[entry_id] = ((name or label)[:100], (value or label)[:100], suffixes)
+
+    def remove(self, guild_id: int, entry_id):
+        entry = self._entries.get(guild_id, {}).pop(entry_id, None)
+        if entry is None:
+            return
+        keys = self._keys[guild_id]
+        for suffix in entry[2]:
+            del keys[bisect.bisect_left(keys, (suffix, entry_id))]
+
+    def search(self, guild_id: int, query: str, limit: int = MAX_CHOICES) -> list[app_commands.Choice[str]]:
+        """Prefix matches first, then substring matches, then close misspellings."""
+        entries = self._entries.get(guild_id)
+        if not entries:
+            return []
+        keys = self._keys[guild_id]
+        query = " ".join(query.casefold().split())
+        found = {}
+
+        i = bisect.bisect_left(keys, (query,))
+        while i < len(keys) and len(found) < limit and keys[i][0].startswith(query):
+            found.setdefault(keys[i][1], None)
+            i += 1
+
+        if query and len(found) < limit:
+            for scanned, (entry_id, entry) in enumerate(entries.items()):
+                if len(found) >= limit or scanned >= MAX_SUBSTRING_SCAN:
+                    break
+                if query in entry[2][0]:
+                    found.setdefault(entry_id, None)
+
+        if query and not found:
+            # Likely a typo: rank words sharing the first letter by similarity to the query.
+            start = bisect.bisect_left(keys, (query[0],))
+            matcher = difflib.SequenceMatcher(b=query) # The query side is preprocessed once
+            candidates = {}
+            for suffix, entry_id in keys[start:start + MAX_FUZZY_SCAN]:
+                if suffix[0] != query[0]:
+                    break
+                matcher.set_seq1(suffix[:len(query) + 2])
+                if matcher.quick_ratio() < 0.6:
+                    continue
+                ratio = matcher.ratio()
+                if ratio >= 0.6 and ratio > candidates.get(entry_id, 0):
+                    candidates[entry_id] = ratio
+            found = dict.fromkeys(sorted(candidates, key=candidates.get, reverse=True)[:limit])
+
+        return [app_commands.Choice(name=entries[entry_id][0], value=entries[entry_id][1]) for entry_id in found]
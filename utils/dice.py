@@ -0,0 +1,361 @@
+import functools
+import math
+import re
+import numpy as np
+
+# Limits keep a single /rolldice call well inside the interaction deadline.
+MAX_DICE = 10_000_000      # Dice in one term of one roll
+MAX_SIDES = 1_000_000
+MAX_REPEATS = 20           # The N in `Nx <expression>`
+MAX_EXPLOSIONS = 50        # Re-rolls of a single exploding die
+BATCH_SIZE = 1_000_000     # Dice sampled per NumPy call, bounds peak memory
+STATS_BUDGET = 20_000_000  # Total dice sampled for a distribution preview
+MAX_TRIALS = 200_000
+MIN_TRIALS = 1_000         # Fewer simulated rolls than this do not describe a distribution
+DETAIL_LIMIT = 30          # Individual rolls are only listed for pools this small
+FACE_COUNT_MAX_SIDES = 1_000
+MAX_CONSTANT = 10**9       # Constants and success targets; keeps int64 totals far from overflowing
+
+REPEAT_RE = re.compile(r"^(\d+)\s*x\s*(.+)$")
+TERM_RE = re.compile(r"""
+    \s*(?P<sign>[+-])?\s*
+    (?:
+        (?P<count>\d*)d(?P<sides>\d+|%)
+        (?P<explode>!)?
+        (?:(?P<keep>kh|kl|dh|dl|k|d)(?P<keep_n>\d+))?
+        (?:(?P<cmp>>=|<=|>|<)(?P<target>\d+))?
+      | (?P<const>\d+)
+    )\s*""", re.VERBOSE)
+
+class DiceError(ValueError):
+    """Raised for expressions that cannot be parsed or exceed the engine's limits."""
+
+class DiceTerm:
+    """A pool such as `4d6kh3`, `10d10!` or `100d20>15`.
+
+    Exploding dice are compounded into the die that exploded (what many dice rollers
+    write as `!!`), which keeps every pool rectangular so whole batches of rolls can be
+    sampled with a single NumPy call. Sums match separately exploding dice, but keep/drop
+    and success counts see each original die once.
+    """
+    def __init__(self, count: int, sides: int, explode: bool = False, keep: tuple = None, success: tuple = None):
+        self.count = count
+        self.sides = sides
+        self.explode = explode
+        self.keep = keep # ("h" | "l", n) after drops are converted to keeps
+        self.success = success # (operator, target)
+
+    def _uses_face_counts(self) -> bool:
+        """Plain pools larger than their die can be sampled as per-face counts instead of individual dice."""
+        return not self.explode and not self.keep and self.count > self.sides and self.sides <= FACE_COUNT_MAX_SIDES
+
+    def _sample_face_counts(self, rng: np.random.Generator, rows: int) -> np.ndarray:
+        if self.success:
+            op, target = self.success
+            faces = np.arange(1, self.sides + 1)
+            hits = {">": faces > target, ">=": faces >= target, "<": faces < target, "<=": faces <= target}[op]
+            return rng.binomial(self.count, hits.mean(), size=rows).astype(np.int64)
+
+        faces = np.arange(1, self.sides + 1, dtype=np.int64)
+        pvals = np.full(self.sides, 1 / self.sides)
+        scores = np.empty(rows, dtype=np.int64)
+        step = max(1, BATCH_SIZE // self.sides)
+        for start in range(0, rows, step):
+            stop = min(rows, start + step)
+            scores[start:stop] = rng.multinomial(self.count, pvals, size=stop - start) @ faces
+        return scores
+
+    def _sample(self, rng: np.random.Generator, rows: int, count: int) -> np.ndarray:
+        rolls = rng.integers(1, self.sides + 1, size=(rows, count), dtype=np.int64)
+        if self.explode:
+            rows_idx, cols_idx = np.nonzero(rolls == self.sides)
+            for _ in range(MAX_EXPLOSIONS):
+                if not rows_idx.size:
+                    break
+                extra = rng.integers(1, self.sides + 1, size=rows_idx.size, dtype=np.int64)
+                rolls[rows_idx, cols_idx] += extra
+                again = extra == self.sides
+                rows_idx, cols_idx = rows_idx[again], cols_idx[again]
+        return rolls
+
+    def _kept(self, rolls: np.ndarray) -> np.ndarray:
+        if not self.keep:
+            return rolls
+        side, n = self.keep
+        if side == "h":
+            return np.partition(rolls, self.count - n, axis=1)[:, self.count - n:]
+        return np.partition(rolls, n - 1, axis=1)[:, :n]
+
+    def _score(self, kept: np.ndarray) -> np.ndarray:
+        if not self.success:
+            return kept.sum(axis=1)
+        op, target = self.success
+        hits = {">": kept > target, ">=": kept >= target, "<": kept < target, "<=": kept <= target}[op]
+        return hits.sum(axis=1)
+
+    def sample(self, rng: np.random.Generator, rows: int) -> np.ndarray:
+        """Returns one score per row, sampling at most BATCH_SIZE dice at a time."""
+        if self._uses_face_counts():
+            return self._sample_face_counts(rng, rows)
+
+        scores = np.empty(rows, dtype=np.int64)
+        if self.count > BATCH_SIZE and not self.keep:
+            # A single huge pool: sum or count successes chunk by chunk.
+            for row in range(rows):
+                total = 0
+                for start in range(0, self.count, BATCH_SIZE):
+                    rolls = self._sample(rng, 1, min(BATCH_SIZE, self.count - start))
+                    total += int(self._score(rolls)[0])
+                scores[row] = total
+            return scores
+
+        step = max(1, BATCH_SIZE // self.count)
+        for start in range(0, rows, step):
+            stop = min(rows, start + step)
+            scores[start:stop] = self._score(self._kept(self._sample(rng, stop - start, self.count)))
+        return scores
+
+    def roll_detailed(self, rng: np.random.Generator) -> tuple[int, str]:
+        """Rolls once and describes the individual dice, striking through dropped ones."""
+        if self.count > DETAIL_LIMIT:
+            return int(self.sample(rng, 1)[0]), f"{self.count:,}d{self.sides}"
+
+        rolls = self._sample(rng, 1, self.count)
+        score = int(self._score(self._kept(rolls))[0])
+        values = rolls[0].tolist()
+        dropped = set()
+        if self.keep:
+            side, n = self.keep
+            order = sorted(range(len(values)), key=lambda i: values[i], reverse=(side == "h"))
+            dropped = set(order[n:])
+        shown = [f"~~{v}~~" if i in dropped else str(v) for i, v in enumerate(values)]
+        return score, f"[{', '.join(shown)}]"
+
+    def dice_per_roll(self) -> int:
+        return self.count
+
+    def cost(self) -> int:
+        """Values sampled per roll, used to size distribution previews."""
+        return self.sides if self._uses_face_counts() else self.count
+
+    def _levels(self):
+        """Yields (base, weight) for each explosion level of one die.
+
+        Level k holds the values k*sides + r for r in 1..sides-1, each with probability
+        weight; the last item is the value left when MAX_EXPLOSIONS re-rolls all exploded.
+        """
+        if not self.explode:
+            yield 0, 1 / self.sides # Plain die: values 1..sides
+            return
+        for k in range(MAX_EXPLOSIONS + 1):
+            weight = self.sides ** -(k + 1)
+            if weight < 1e-18:
+                return
+            yield k * self.sides, weight
+        yield None, self.sides ** -(MAX_EXPLOSIONS + 1)
+
+    def moments(self):
+        """Exact mean and variance of this term's score, or None for keep/drop pools."""
+        if self.keep:
+            return None
+        top = self.sides if not self.explode else self.sides - 1 # Highest r within one level
+        if self.success:
+            op, target = self.success
+            p = 0.0
+            for base, weight in self._levels():
+                if base is None:
+                    value = (MAX_EXPLOSIONS + 1) * self.sides
+                    p += weight if {">": value > target, ">=": value >= target, "<": value < target, "<=": value <= target}[op] else 0
+                    continue
+                t = target - base
+                lo, hi = {">": (t + 1, top), ">=": (t, top), "<": (1, t - 1), "<=": (1, t)}[op]
+                p += weight * max(0, min(hi, top) - max(lo, 1) + 1)
+            return self.count * p, self.count * p * (1 - p)
+
+        mean = second = 0.0
+        for base, weight in self._levels():
+            if base is None:
+                value = (MAX_EXPLOSIONS + 1) * self.sides
+                mean += weight * value
+                second += weight * value ** 2
+                continue
+            # r is uniform on 1..top within the level
+            level_mean = base + (top + 1) / 2
+            level_second = level_mean ** 2 + (top ** 2 - 1) / 12
+            mean += weight * top * level_mean
+            second += weight * top * level_second
+        return self.count * mean, self.count * (second - mean ** 2)
+
+class ConstantTerm:
+    def __init__(self, value: int):
+        self.value = value
+
+    def sample(self, rng: np.random.Generator, rows: int) -> np.ndarray:
+        return np.full(rows, self.value, dtype=np.int64)
+
+    def roll_detailed(self, rng: np.random.Generator) -> tuple[int, str]:
+        return self.value, str(self.value)
+
+    def dice_per_roll(self) -> int:
+        return 0
+
+    def cost(self) -> int:
+        return 0
+
+    def moments(self):
+        return float(self.value), 0.0
+
+class DiceExpression:
+    """A parsed expression: signed terms, optionally repeated (`6x 4d6kh3`)."""
+    def __init__(self, text: str, terms: list, repeats: int = 1):
+        self.text = text
+        self.terms = terms # (sign, term) pairs
+        self.repeats = repeats
+
+    @property
+    def dice_per_roll(self) -> int:
+        return sum(term.dice_per_roll() for _, term in self.terms)
+
+    def roll(self, rng: np.random.Generator = None) -> list[tuple[int, str]]:
+        """Rolls the expression `repeats` times, returning (total, breakdown) for each roll."""
+        rng = rng or np.random.default_rng()
+        results = []
+        for _ in range(self.repeats):
+            total, parts = 0, []
+            for sign, term in self.terms:
+                value, detail = term.roll_detailed(rng)
+                total += sign * value
+                parts.append(("- " if sign < 0 else "+ " if parts else "") + detail)
+            results.append((total, " ".join(parts)))
+        return results
+
+    def simulate(self, trials: int, rng: np.random.Generator = None) -> np.ndarray:
+        """Samples the totals of `trials` independent rolls in NumPy batches."""
+        rng = rng or np.random.default_rng()
+        totals = np.zeros(trials, dtype=np.int64)
+        for sign, term in self.terms:
+            totals += sign * term.sample(rng, trials)
+        return totals
+
+    def _trials(self) -> int:
+        cost = sum(term.cost() for _, term in self.terms)
+        return min(MAX_TRIALS, STATS_BUDGET // max(1, cost))
+
+    def stats_method(self) -> str:
+        """How `stats()` will describe this expression: "simulated" or "normal".
+
+        Pools too large to simulate MIN_TRIALS rolls fall back to a normal approximation
+        built from the exact per-die moments; keep/drop pools have no such shortcut and
+        raise DiceError instead.
+        """
+        if self._trials() >= MIN_TRIALS:
+            return "simulated"
+        if all(term.moments() is not None for _, term in self.terms):
+            return "normal"
+        raise DiceError(f"`{self.text}` is too large for a distribution preview. Keep/drop pools are limited to {STATS_BUDGET // MIN_TRIALS:,} dice.")
+
+    def stats(self, rng: np.random.Generator = None, bins: int = 10) -> dict:
+        """Describes the distribution of a single roll. Histogram entries are (low, high, share of rolls)."""
+        if self.stats_method() == "normal":
+            return self._normal_stats(bins)
+
+        trials = self._trials()
+        totals = self.simulate(trials, rng)
+        low, high = int(totals.min()), int(totals.max())
+        if high - low < bins:
+            edges = np.arange(low, high + 2) # One bin per possible total
+        else:
+            edges = np.linspace(low, high + 1, bins + 1)
+        counts, edges = np.histogram(totals, bins=edges)
+        return {
+            "method": "simulated",
+            "trials": trials,
+            "mean": float(totals.mean()),
+            "std": float(totals.std()),
+            "min": low,
+            "max": high,
+            "histogram": [(int(np.ceil(edges[i])), int(np.ceil(edges[i + 1])) - 1, int(c) / trials) for i, c in enumerate(counts)],
+        }
+
+    def _normal_stats(self, bins: int) -> dict:
+        mean = var = 0.0
+        for sign, term in self.terms:
+            term_mean, term_var = term.moments()
+            mean += sign * term_mean
+            var += term_var
+        std = math.sqrt(var)
+        low, high = math.floor(mean - 4 * std), math.ceil(mean + 4 * std)
+
+        def cdf(x: float) -> float:
+            return 0.5 * (1 + math.erf((x - mean) / (std * math.sqrt(2)))) if std else float(x >= mean)
+
+        edges = [math.ceil(e) for e in np.linspace(low, high + 1, min(bins, high - low + 1) + 1)]
+        histogram = [(a, b - 1, cdf(b - 0.5) - cdf(a - 0.5)) for a, b in zip(edges, edges[1:]) if b > a]
+        return {"method": "normal", "trials": 0, "mean": mean, "std": std, "min": low, "max": high, "histogram": histogram}
+
+def _parse_term(match: re.Match) -> tuple[int, object]:
+    sign = -1 if match.group("sign") == "-" else 1
+    if match.group("const") is not None:
+        value = int(match.group("const"))
+        if value > MAX_CONSTANT:
+            raise DiceError(f"Constants can be at most {MAX_CONSTANT:,}.")
+        return sign, ConstantTerm(value)
+
+    count = int(match.group("count") or 1)
+    sides = 100 if match.group("sides") == "%" else int(match.group("sides"))
+    if not (1 <= count <= MAX_DICE):
+        raise DiceError(f"Use between 1 and {MAX_DICE:,} dice per term.")
+    if not (1 <= sides <= MAX_SIDES):
+        raise DiceError(f"Dice must have between 1 and {MAX_SIDES:,} sides.")
+
+    explode = match.group("explode") is not None
+    if explode and sides == 1:
+        raise DiceError("A one-sided die cannot explode.")
+
+    keep = None
+    if match.group("keep"):
+        op, n = match.group("keep"), int(match.group("keep_n"))
+        if op in ("d", "dl", "dh"):
+            if n >= count:
+                raise DiceError("You cannot drop every die in the pool.")
+            keep = ("h" if op in ("d", "dl") else "l", count - n)
+        elif n < 1:
+            raise DiceError("You must keep at least one die.")
+        else:
+            keep = ("l" if op == "kl" else "h", min(n, count))
+        if keep[1] == count:
+            keep = None
+
+    success = None
+    if match.group("cmp"):
+        success = (match.group("cmp"), int(match.group("target")))
+        if success[1] > MAX_CONSTANT:
+            raise DiceError(f"Success targets can be at most {MAX_CONSTANT:,}.")
+    return sign, DiceTerm(count, sides, explode, keep, success)
+
+@functools.lru_cache(maxsize=512)
+def parse(text: str) -> DiceExpression:
+    """Compiles a dice expression. Results are cached, so repeated expressions are parsed once."""
+    source = text.strip().lower()
+    repeats = 1
+    repeat_match = REPEAT_RE.match(source)
+    if repeat_match:
+        repeats = int(repeat_match.group(1))
+        source = repeat_match.group(2)
+        if not (1 <= repeats <= MAX_REPEATS):
+            raise DiceError(f"You can repeat a roll between 1 and {MAX_REPEATS} times.")
+
+    terms, pos = [], 0
+    while pos < len(source):
+        match = TERM_RE.match(source, pos)
+        if not match or match.end() == pos or (terms and not match.group("sign")):
+            raise DiceError(f"Could not understand `{source[pos:]}`. Try something like `4d6kh3+2`.")
+        terms.append(_parse_term(match))
+        pos = match.end()
+
+    if not any(isinstance(term, DiceTerm) for _, term in terms):
+        raise DiceError("The expression must contain at least one die, e.g. `2d6`.")
+    expression = DiceExpression(text.strip(), terms, repeats)
+    if expression.dice_per_roll * repeats > MAX_DICE:
+        raise DiceError(f"That is more than {MAX_DICE:,} dice in total.")
+    return expression
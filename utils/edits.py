@@ -0,0 +1,72 @@
+import time
+import asyncio
+import logging
+import discord
+
+log = logging.getLogger(__name__)
+
+MIN_INTERVAL = 5.0 # Seconds between edits of the same message when the API is healthy
+MAX_INTERVAL = 60.0
+SLOW_EDIT = 1.0 # An edit taking longer than this was most likely held back by a rate limit
+
+class CoalescedEditor:
+    """Coalesces bursts of edits to the same message into a few API calls.
+
+    Callers request an edit with a `render` callback instead of the new content. Each
+    message gets at most one edit per interval, rendered from the latest state when it
+    is sent, so 500 clicks in a minute produce a handful of edits. The interval backs
+    off when edits slow down or hit 429s and recovers while they stay fast.
+    """
+    def __init__(self, min_interval: float = MIN_INTERVAL, max_interval: float = MAX_INTERVAL):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.pending = {} # message_id -> (message, render)
+        self.tasks = {}
+        self.requests = 0
+        self.edits = 0
+
+    def request(self, message: discord.Message | discord.PartialMessage, render):
+        """Schedules an edit. `render()` returns the `edit()` keyword arguments, or None to skip the edit."""
+        self.requests += 1
+        self.pending[message.id] = (message, render)
+        if message.id not in self.tasks:
+            self.tasks[message.id] = asyncio.create_task(self._flush(message.id))
+
+    async def _flush(self, message_id: int):
+        try:
+            while message_id in self.pending:
+                await asyncio.sleep(self.interval) # Let the rest of the burst arrive
+                message, render = self.pending.pop(message_id)
+                kwargs = render()
+                if kwargs is None:
+                    continue
+                started = time.monotonic()
+                try:
+                    await message.edit(**kwargs)
+                except discord.NotFound:
+                    self.pending.pop(message_id, None)
+                    return
+                except discord.HTTPException as e:
+                    if e.status == 429 or e.status >= 500:
+                        # Back off and retry with whatever state is newest by then.
+                        self.interval = min(self.max_interval, self.interval * 2)
+                        self.pending.setdefault(message_id, (message, render))
+                    log.warning("Failed to edit message %s: %s", message_id, e)
+                    continue
+                self.edits += 1
+                self._adapt(time.monotonic() - started)
+        finally:
+            self.tasks.pop(message_id, None)
+
+    def _adapt(self, elapsed: float):
+        if elapsed > SLOW_EDIT:
+            self.interval = min(self.max_interval, self.interval * 2)
+        else:
+            self.interval = max(self.min_interval, self.interval * 0.75)
+
+    def close(self):
+        for task in self.tasks.values():
+            task.cancel()
+        self.tasks.clear()
+        self.pending.clear()
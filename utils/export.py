@@ -0,0 +1,66 @@
+import io
+import re
+import csv
+import gzip
+import json
+import asyncio
+import tempfile
+import discord
+
+# Exports up to this size stay in memory; larger ones are spooled to a temporary file.
+SPOOL_SIZE = 1024 * 1024
+
+def write_export(header: list[str], rows, file_format: str = "csv", compress: bool = False) -> tuple[tempfile.SpooledTemporaryFile, int]:
+    """Streams rows into a CSV or JSON file, gzipped if asked. Returns the rewound file and its size in bytes.
+
+    Rows are written one at a time, so memory stays bounded by SPOOL_SIZE however many
+    rows the iterable produces. Pass Discord IDs as strings: JSON readers that parse
+    numbers as doubles would round them. This blocks, so run it in an executor.
+    """
+    out = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)
+    raw = gzip.GzipFile(fileobj=out, mode="wb") if compress else out
+    text = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+
+    if file_format == "csv":
+        writer = csv.writer(text)
+        writer.writerow(header)
+        for row in rows:
+            writer.writerow(row)
+    else:
+        text.write("[")
+        for i, row in enumerate(rows):
+            text.write(",\n" if i else "\n")
+            json.dump(dict(zip(header, row)), text, ensure_ascii=False)
+        text.write("\n]\n")
+
+    text.flush()
+    text.detach() # Leave the underlying file open
+    if compress:
+        raw.close() # Writes the gzip trailer; `out` itself stays open
+    size = out.tell()
+    out.seek(0)
+    return out, size
+
+async def export_file(filename: str, header: list[str], rows, file_format: str = "csv", compress: bool = False) -> tuple[discord.File, int]:
+    """Builds an export attachment in a worker thread so large exports never block the event loop.
+
+    `rows` is consumed on the worker thread, so pass a generator over a snapshot of
+    the data rather than over live state that commands may still be changing. Characters
+    other than letters, digits, `_` and `-` in `filename` are replaced with dashes.
+    """
+    loop = asyncio.get_running_loop()
+    fp, size = await loop.run_in_executor(None, write_export, header, rows, file_format, compress)
+    filename = re.sub(r"[^\w-]+", "-", filename).strip("-") or "export" # Names can come from user input
+    filename = f"{filename}.{file_format}" + (".gz" if compress else "")
+    return discord.File(fp, filename=filename), size
+
+async def send_export(interaction: discord.Interaction, filename: str, header: list[str], rows, file_format: str = "csv", compress: bool = False):
+    """Defers, builds the export off the event loop and sends it as an ephemeral attachment."""
+    await interaction.response.defer(ephemeral=True, thinking=True)
+    file, size = await export_file(filename, header, rows, file_format, compress)
+    limit = interaction.guild.filesize_limit if interaction.guild else discord.utils.DEFAULT_FILE_SIZE_LIMIT_BYTES
+    if size > limit:
+        file.close()
+        hint = "" if compress else " Try again with `compress` enabled."
+        return await interaction.followup.send(f"❌ The export is {size / 1024 / 1024:.1f} MB, which is over this server's upload limit.{hint}", ephemeral=True)
+    await interaction.followup.send(file=file, ephemeral=True)
@@ -0,0 +1,153 @@
+import time
+import asyncio
+import logging
+import collections
+import discord
+
+log = logging.getLogger(__name__)
+
+# Discord drops interactions that are not acknowledged within 3 seconds of being created.
+# The budget is measured from when the bot receives the interaction, so it leaves room
+# for gateway delivery and the defer request itself.
+RESPONSE_BUDGET = 2.0
+HISTORY_SIZE = 20 # Recent latencies kept per command
+SLOW_PERCENTILE = 0.9
+
+class CommandLatency:
+    """Recent time-to-first-response samples and auto-defer counts for one command."""
+    def __init__(self):
+        self.samples = collections.deque(maxlen=HISTORY_SIZE)
+        self.invocations = 0
+        self.predicted_defers = 0 # Deferred up front because the command is usually slow
+        self.watchdog_defers = 0 # Deferred because the budget ran out mid-command
+        self.ephemeral_responses = 0
+        self.public_responses = 0
+
+    def predicted(self) -> float:
+        """The 90th percentile of recent latencies, or 0 before there is any history."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * SLOW_PERCENTILE))]
+
+    @property
+    def prefers_ephemeral(self) -> bool:
+        """Whether the command has mostly answered ephemerally. Private until it has answered publicly more often."""
+        return self.ephemeral_responses >= self.public_responses
+
+class GuardedResponse(discord.InteractionResponse):
+    """An `interaction.response` that never raises `InteractionResponded`.
+
+    Once the interaction has been acknowledged (by the command or by the guard),
+    `send_message` is routed to a followup and `defer` becomes a no-op, so command
+    code and error handlers work the same whether or not the guard stepped in.
+    """
+    def __init__(self, parent: discord.Interaction):
+        super().__init__(parent)
+        self.lock = asyncio.Lock()
+        self.received_at = time.monotonic()
+        self.first_call_at = None # When the command itself first tried to respond
+        self.first_ephemeral = None
+        self.auto_deferred = False
+        self.watchdog = None
+
+    def _mark_call(self, ephemeral: bool = None):
+        if self.first_call_at is None:
+            self.first_call_at = time.monotonic()
+            self.first_ephemeral = ephemeral
+
+    async def send_message(self, content=None, **kwargs):
+        self._mark_call(kwargs.get("ephemeral", False))
+        async with self.lock:
+            if not self.is_done():
+                return await super().send_message(content, **kwargs)
+        kwargs.pop("delete_after", None) # Not supported by followups
+        if content is not None:
+            kwargs["content"] = content
+        return await self._parent.followup.send(**kwargs)
+
+    async def defer(self, *, ephemeral: bool = False, thinking: bool = False):
+        self._mark_call(ephemeral)
+        async with self.lock:
+            if not self.is_done():
+                return await super().defer(ephemeral=ephemeral, thinking=thinking)
+
+    async def send_modal(self, modal: discord.ui.Modal):
+        self._mark_call()
+        async with self.lock:
+            return await super().send_modal(modal)
+
+    async def auto_defer(self, ephemeral: bool) -> bool:
+        """Defers on the command's behalf. Returns False if it had already responded."""
+        async with self.lock:
+            if self.is_done():
+                return False
+            await super().defer(ephemeral=ephemeral, thinking=True)
+            self.auto_deferred = True
+            return True
+
+class DeadlineGuard:
+    """Learns how long each command takes to respond and defers before it would miss the deadline.
+
+    A deferral fixes whether the eventual reply is ephemeral, so commands declare it with
+    `extras={"ephemeral": ...}`. Commands that do not are deferred the way they have
+    usually answered, and ephemerally before there is any history.
+    """
+    def __init__(self, budget: float = RESPONSE_BUDGET):
+        self.budget = budget
+        self.stats = {}
+
+    def get_stats(self, name: str) -> CommandLatency:
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = CommandLatency()
+        return stats
+
+    async def watch(self, interaction: discord.Interaction):
+        """Installs the guarded response on a slash command interaction, deferring now if the command is usually slow."""
+        if interaction.type is not discord.InteractionType.application_command or interaction.command is None:
+            return
+
+        response = GuardedResponse(interaction)
+        interaction._cs_response = response # Replaces the lazily created InteractionResponse
+        stats = self.get_stats(interaction.command.qualified_name)
+        stats.invocations += 1
+
+        if stats.predicted() >= self.budget:
+            if await self._defer(interaction, response, stats):
+                stats.predicted_defers += 1
+        else:
+            response.watchdog = asyncio.create_task(self._watchdog(interaction, response, stats))
+
+    async def _watchdog(self, interaction: discord.Interaction, response: GuardedResponse, stats: CommandLatency):
+        await asyncio.sleep(self.budget)
+        if await self._defer(interaction, response, stats):
+            stats.watchdog_defers += 1
+
+    async def _defer(self, interaction: discord.Interaction, response: GuardedResponse, stats: CommandLatency) -> bool:
+        try:
+            ephemeral = interaction.command.extras.get("ephemeral", stats.prefers_ephemeral)
+            deferred = await response.auto_defer(ephemeral=ephemeral)
+        except discord.HTTPException:
+            log.warning("Auto-defer failed for /%s", interaction.command.qualified_name, exc_info=True)
+            return False
+        if deferred:
+            log.info("Auto-deferred /%s (p90 %.2fs)", interaction.command.qualified_name, stats.predicted())
+        return deferred
+
+    def finish(self, interaction: discord.Interaction):
+        """Records how long the command took to respond. Called once it has completed or failed."""
+        response = interaction.response
+        if not isinstance(response, GuardedResponse) or interaction.command is None:
+            return
+        if response.watchdog:
+            response.watchdog.cancel()
+
+        stats = self.get_stats(interaction.command.qualified_name)
+        responded_at = response.first_call_at or time.monotonic()
+        stats.samples.append(responded_at - response.received_at)
+        if response.first_ephemeral is not None:
+            if response.first_ephemeral:
+                stats.ephemeral_responses += 1
+            else:
+                stats.public_responses += 1
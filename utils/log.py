@@ -0,0 +1,118 @@
+import sys
+import copy
+import queue
+import atexit
+import logging
+import threading
+import contextvars
+import logging.handlers
+import discord
+
+# Interaction fields attached to every record logged while a command is being handled.
+log_context = contextvars.ContextVar("log_context", default={})
+
+# Noisy events are logged with `extra={"sample": key}`; only one in every N of them is kept.
+SAMPLE_RATES = {
+    "rsvp": 10,
+}
+
+QUEUE_SIZE = 10_000
+_listener = None
+
+def interaction_context(interaction: discord.Interaction) -> dict:
+    """Returns the command/guild/user fields for an interaction."""
+    return {
+        "command": interaction.command.qualified_name if interaction.command else None,
+        "guild_id": interaction.guild_id,
+        "user_id": interaction.user.id,
+    }
+
+def bind_interaction(interaction: discord.Interaction):
+    """Attaches an interaction's context to everything logged for the rest of the current task."""
+    log_context.set(interaction_context(interaction))
+
+class ContextFilter(logging.Filter):
+    """Copies the bound interaction context onto each record, without overriding explicit `extra` fields."""
+    def filter(self, record: logging.LogRecord) -> bool:
+        for key, value in log_context.get().items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return True
+
+class SamplingFilter(logging.Filter):
+    """Keeps one in every N records that share a `sample` key. Records without the key always pass."""
+    def __init__(self, rates: dict[str, int]):
+        super().__init__()
+        self.rates = rates
+        self.counters = {}
+        self.lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = getattr(record, "sample", None)
+        rate = self.rates.get(key, 1)
+        if key is None or rate <= 1:
+            return True
+        with self.lock:
+            seen = self.counters.get(key, 0)
+            self.counters[key] = seen + 1
+        if seen % rate:
+            return False
+        record.sampled = rate # This record stands in for `rate` events
+        return True
+
+class StructuredFormatter(logging.Formatter):
+    """Formats records as `time level logger: message key=value ...`."""
+    FIELDS = ("command", "guild_id", "user_id", "sampled")
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)-8s %(name)s: %(message)s")
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        fields = " ".join(f"{key}={getattr(record, key)}" for key in self.FIELDS if getattr(record, key, None) is not None)
+        message = super().formatMessage(record)
+        return f"{message} {fields}" if fields else message
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """Hands records to the listener thread without formatting or blocking the caller.
+
+    Only the message arguments are merged here; the formatter (including tracebacks)
+    runs on the listener thread. If the sink falls behind and the queue fills up,
+    records are dropped and counted instead of stalling the event loop.
+    """
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+def setup_logging(level: int = logging.INFO):
+    """Routes all logging through a queue drained by a background thread. Safe to call more than once."""
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue = queue.Queue(maxsize=QUEUE_SIZE)
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter())
+    queue_handler.addFilter(SamplingFilter(SAMPLE_RATES))
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(StructuredFormatter())
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.handlers[:] = [queue_handler]
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
@@ -0,0 +1,66 @@
+import sys
+import asyncio
+import itertools
+import collections
+import tracemalloc
+
+SIZE_SAMPLE = 100 # Items measured per container; the rest is extrapolated
+TOP_LIMIT = 25
+
+def approximate_size(obj, seen: set = None) -> int:
+    """Estimates the deep size of `obj` in bytes, cheaply enough to run against live state.
+
+    Only the first SIZE_SAMPLE items of each container are measured and the result is
+    scaled up to the full length. Discord models are counted shallowly, since they
+    reference the client's shared caches rather than owning them.
+    """
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+
+    if type(obj).__module__.startswith("discord."):
+        return size
+    if isinstance(obj, dict):
+        items = list(itertools.islice(obj.items(), SIZE_SAMPLE))
+        sampled = sum(approximate_size(k, seen) + approximate_size(v, seen) for k, v in items)
+        return size + (sampled * len(obj) // len(items) if items else 0)
+    if isinstance(obj, (list, tuple, set, frozenset, collections.deque)):
+        items = list(itertools.islice(obj, SIZE_SAMPLE))
+        sampled = sum(approximate_size(item, seen) for item in items)
+        return size + (sampled * len(obj) // len(items) if items else 0)
+    if hasattr(obj, "__dict__") and not isinstance(obj, type):
+        size += approximate_size(vars(obj), seen)
+    return size
+
+def state_report(cogs: dict) -> list[tuple[str, str, int | None, int]]:
+    """Returns (cog, name, entries, approximate bytes) for everything cogs expose through `debug_state()`."""
+    rows = []
+    for cog_name, cog in cogs.items():
+        debug_state = getattr(cog, "debug_state", None)
+        if debug_state is None:
+            continue
+        for name, value in debug_state().items():
+            entries = len(value) if hasattr(value, "__len__") else None
+            rows.append((cog_name, name, entries, approximate_size(value)))
+    return rows
+
+def task_report() -> list[tuple[str, int]]:
+    """Counts the running asyncio tasks, grouped by the coroutine they are executing."""
+    counts = collections.Counter()
+    for task in asyncio.all_tasks():
+        coro = task.get_coro()
+        counts[getattr(coro, "__qualname__", type(coro).__name__)] += 1
+    return counts.most_common()
+
+def take_snapshot() -> tracemalloc.Snapshot:
+    """Takes a tracemalloc snapshot without tracemalloc's own allocations. Blocking; run it in a thread."""
+    return tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+
+def compare_snapshots(snapshot: tracemalloc.Snapshot, previous: tracemalloc.Snapshot = None, limit: int = TOP_LIMIT) -> list[str]:
+    """Lists the top allocation sites, or the biggest changes since `previous`. Blocking; run it in a thread."""
+    if previous is None:
+        return [str(stat) for stat in snapshot.statistics("lineno")[:limit]]
+    return [str(stat) for stat in snapshot.compare_to(previous, "lineno")[:limit]]